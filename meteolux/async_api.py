@@ -1,9 +1,13 @@
 """A Python client for the MeteoLux API."""
 
+import asyncio
 import typing
-from typing import Any
+from types import TracebackType
+from typing import Any, Literal, Self, overload
 
 import httpx
+import orjson
+from pydantic import BaseModel, TypeAdapter
 
 from .exceptions import NotFoundError
 from .models import (
@@ -12,16 +16,57 @@ from .models import (
   InObservation,
   ObservationMetadataResponse,
   ObservationResponse,
+  ObservationResponseColumns,
   User,
   WeatherResponse,
 )
 
+try:
+  import msgpack
+except ImportError:
+  msgpack = None
+
+# Validators for the typed endpoints, built once at import time and reused for every response.
+# Responses are always validated: pydantic-core parses and validates in a single pass, which is
+# several times faster than decoding the JSON and building the models unvalidated via model_construct.
+_ADAPTERS: dict[type[BaseModel], TypeAdapter[Any]] = {
+  model: TypeAdapter(model) for model in (ATCReport, Bookmarks, ObservationMetadataResponse, ObservationResponse, ObservationResponseColumns, WeatherResponse)
+}
+
+# Models whose before-validators work on the decoded payload; decoding with orjson first and
+# validating the Python objects is faster for these than validate_json.
+_DECODE_FIRST: frozenset[type[BaseModel]] = frozenset({ObservationResponseColumns})
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+_MSGPACK_CONTENT_TYPES = ('application/msgpack', 'application/x-msgpack')
+_MSGPACK_MISSING = 'MessagePack support requires the msgpack package, install python-meteolux[msgpack].'
+
+_LANGCODES = ('fr', 'de', 'en', 'lb')
+
+# Endpoints without path or query parameters, whose URLs are built once per client.
+_STATIC_ENDPOINTS = (
+  '/atc/report',
+  '/hvd/observations',
+  '/hvd/observations/metadata',
+  '/hvd/stations',
+  '/metapp/user',
+  '/metapp/observations',
+  '/metapp/observation',
+)
+
 
 class AsyncMeteoLuxClient:
   """A Python client for the MeteoLux API, built with httpx and Pydantic.
 
   This client is generated from the OpenAPI specification and provides
   methods for all available endpoints, returning structured Pydantic models.
+
+  It can be used as an async context manager, which closes the underlying
+  httpx client on exit:
+
+      async with AsyncMeteoLuxClient() as client:
+          weather = await client.get_weather()
   """
 
   def __init__(
@@ -29,62 +74,130 @@ class AsyncMeteoLuxClient:
     base_url: str = 'https://metapi.ana.lu/api/v1',
     session: httpx.AsyncClient | None = None,
     timeout: int = 10,
+    accept: str | None = None,
   ) -> None:
     """Initializes the client with the base URL.
 
     Args:
         base_url (str): The base URL for the API.
-        session (httpx.AsyncClient, optional): An optional session to use.
+        session (httpx.AsyncClient, optional): An optional session to use, e.g. to share one connection pool between
+            several clients. It is not closed by this client. If omitted, an HTTP/2 enabled client with a keep-alive
+            connection pool is created.
         timeout (int, optional): The maximum number of seconds to wait before timing out a request.
+        accept (str, optional): The Accept header sent with each request, `application/json` by default. Set it to
+            `application/msgpack` to have MessagePack responses decoded, if the server or a proxy in front of it
+            supports that; this needs the `msgpack` extra. JSON responses are handled either way. Cannot be combined
+            with `session`; set the header on the session instead.
+
+    Raises:
+        ValueError: If both `accept` and `session` are given.
+        ImportError: If MessagePack is accepted but the msgpack package is not installed.
     """
+    if session is not None and accept is not None:
+      raise ValueError('accept cannot be combined with session, set the Accept header on the session instead.')
+    if accept is None:
+      accept = 'application/json'
+    if 'msgpack' in accept.lower() and msgpack is None:
+      raise ImportError(_MSGPACK_MISSING)
+
     if base_url.endswith('/'):
       base_url = base_url[:-1]
 
     self.base_url = base_url
 
+    # Pre-encoded URLs for the language-only queries, the most common case. Building a URL
+    # from a string and query parameters is the bulk of httpx's per-request overhead. They are
+    # only used while the session has no default params, as httpx replaces the query of a URL
+    # with those instead of merging them.
+    self._weather_urls = self._lang_urls('/metapp/weather', 'langcode')
+    self._bookmarks_urls = self._lang_urls('/metapp/bookmarks', 'langcode')
+    self._text_urls = self._lang_urls('/metapp/text', 'lang')
+    self._static_urls = {endpoint: httpx.URL(f'{self.base_url}{endpoint}') for endpoint in _STATIC_ENDPOINTS}
+
     if session is None:
-      self.client = httpx.AsyncClient(timeout=timeout)
+      self.client = httpx.AsyncClient(
+        timeout=timeout,
+        headers={'Accept': accept},
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+      )
     else:
       self.client = session
 
-  async def _request(self, method: str, endpoint: str, response_model: Any | None = None, **kwargs: Any) -> Any:
+    self._close_session = session is None
+    self._request_fn = self.client.request
+
+  async def __aenter__(self) -> Self:
+    """Enter the async context manager."""
+    return self
+
+  async def __aexit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None) -> None:
+    """Exit the async context manager and close the client."""
+    await self.close()
+
+  def _lang_urls(self, endpoint: str, key: str) -> dict[str, httpx.URL]:
+    """Pre-encode the URL of an endpoint for every supported language.
+
+    Args:
+        endpoint (str): The API endpoint path.
+        key (str): The name of the language query parameter.
+
+    Returns:
+        dict[str, httpx.URL]: The URLs, keyed by language code.
+    """
+    return {lang: httpx.URL(f'{self.base_url}{endpoint}', params={key: lang}) for lang in _LANGCODES}
+
+  async def _request(
+    self, method: str, endpoint: str | httpx.URL, response_model: type[BaseModel] | None = None, body: BaseModel | None = None, **kwargs: Any
+  ) -> Any:
     """Internal method to handle all API requests and common error handling.
 
     Args:
         method (str): The HTTP method (e.g., "GET", "POST").
-        endpoint (str): The API endpoint path.
-        response_model (Optional[Any]): The Pydantic model to use for response parsing.
-        **kwargs: Additional arguments for the httpx request (e.g., params, json).
+        endpoint (str | httpx.URL): The API endpoint path, or an already complete URL.
+        response_model (Optional[type[BaseModel]]): The Pydantic model to use for response parsing.
+        body (Optional[BaseModel]): A Pydantic model instance to send as JSON request body, serialized by alias.
+        **kwargs: Additional arguments for the httpx request (e.g., params).
 
     Returns:
         Any: The Pydantic model instance or raw JSON data.
 
     Raises:
         NotFoundError: If the API returns a 404 Not Found status code.
+        ImportError: If the API returns MessagePack but the msgpack package is not installed.
         httpx.HTTPStatusError: If the response status code is another error.
         httpx.RequestError: For network-related issues.
     """
-    _endpoint = f'{self.base_url}{endpoint}'
+    if isinstance(endpoint, str):
+      endpoint = self._static_urls.get(endpoint) or f'{self.base_url}{endpoint}'
 
-    try:
-      response = await self.client.request(method, _endpoint, **kwargs)
-      response.raise_for_status()
+    if body is not None:
+      kwargs['content'] = body.model_dump_json(by_alias=True).encode()
+      kwargs['headers'] = _JSON_HEADERS
 
-      if response.status_code == 204:
-        return None
+    response = await self._request_fn(method, endpoint, **kwargs)
 
-      data = response.json()
-      if response_model:
-        return response_model.model_validate(data)
-      return data
+    status_code = response.status_code
+    if status_code == 204:
+      return None
+    if status_code == 404:
+      raise NotFoundError(detail=response.text)
+    if not response.is_success:
+      response.raise_for_status()
 
-    except httpx.HTTPStatusError as exc:
-      if exc.response.status_code == 404:
-        raise NotFoundError(detail=exc.response.text) from exc
+    if response.headers.get('content-type', '').lower().startswith(_MSGPACK_CONTENT_TYPES):
+      if msgpack is None:
+        raise ImportError(_MSGPACK_MISSING)
+      data = msgpack.unpackb(response.content, raw=False)
+      if response_model is not None:
+        return _ADAPTERS[response_model].validate_python(data)
+      return data
 
-      raise
-    except httpx.RequestError:
-      raise
+    if response_model is None:
+      return orjson.loads(response.content)
+    if response_model in _DECODE_FIRST:
+      return _ADAPTERS[response_model].validate_python(orjson.loads(response.content))
+    return _ADAPTERS[response_model].validate_json(response.content)
 
   # --- ATC Endpoints ---
 
@@ -101,16 +214,27 @@ class AsyncMeteoLuxClient:
 
   # --- HVD Endpoints ---
 
-  async def get_observations_hvd(self) -> ObservationResponse:
+  @overload
+  async def get_observations_hvd(self, fast: Literal[False] = False) -> ObservationResponse: ...
+
+  @overload
+  async def get_observations_hvd(self, fast: Literal[True]) -> ObservationResponseColumns: ...
+
+  async def get_observations_hvd(self, fast: bool = False) -> ObservationResponse | ObservationResponseColumns:
     """Return last minute observation data.
 
     Corresponds to GET /hvd/observations.
 
+    Args:
+        fast (bool): Return the data column-wise as ObservationResponseColumns, which is considerably
+            faster to build than one model per sensor.
+
     Returns:
-        ObservationResponse: An ObservationResponse Pydantic model instance.
+        ObservationResponse | ObservationResponseColumns: An ObservationResponse Pydantic model instance, or
+            an ObservationResponseColumns instance if `fast` is set.
     """
     endpoint = '/hvd/observations'
-    return await self._request('GET', endpoint, response_model=ObservationResponse)
+    return await self._request('GET', endpoint, response_model=ObservationResponseColumns if fast else ObservationResponse)
 
   async def get_observations_metadata_hvd(self) -> ObservationMetadataResponse:
     """Return observations metadata.
@@ -164,14 +288,17 @@ class AsyncMeteoLuxClient:
     Returns:
         WeatherResponse: A WeatherResponse Pydantic model instance.
     """
+    if city is None and lat is None and long is None and langcode in self._weather_urls and not self.client.params:
+      return await self._request('GET', self._weather_urls[langcode], response_model=WeatherResponse)
+
     endpoint = '/metapp/weather'
-    params: dict[str, str] = {'langcode': langcode}
+    params: list[tuple[str, str | int | float]] = [('langcode', langcode)]
     if city is not None:
-      params['city'] = str(city)
+      params.append(('city', city))
     if lat is not None:
-      params['lat'] = str(lat)
+      params.append(('lat', lat))
     if long is not None:
-      params['long'] = str(long)
+      params.append(('long', long))
     return await self._request('GET', endpoint, params=params, response_model=WeatherResponse)
 
   async def update_user(self, user_data: User) -> None:
@@ -183,7 +310,7 @@ class AsyncMeteoLuxClient:
         user_data (User): A Pydantic User model instance.
     """
     endpoint = '/metapp/user'
-    await self._request('POST', endpoint, json=user_data.model_dump(by_alias=True))
+    await self._request('POST', endpoint, body=user_data)
 
   async def get_bookmarks(self, langcode: str = 'fr', lat: float | None = None, long: float | None = None) -> Bookmarks:
     """Return all cities and the closest one if lat/long are given.
@@ -198,12 +325,15 @@ class AsyncMeteoLuxClient:
     Returns:
         Bookmarks: A Bookmarks Pydantic model instance.
     """
+    if lat is None and long is None and langcode in self._bookmarks_urls and not self.client.params:
+      return await self._request('GET', self._bookmarks_urls[langcode], response_model=Bookmarks)
+
     endpoint = '/metapp/bookmarks'
-    params: dict[str, str] = {'langcode': langcode}
+    params: list[tuple[str, str | float]] = [('langcode', langcode)]
     if lat is not None:
-      params['lat'] = str(lat)
+      params.append(('lat', lat))
     if long is not None:
-      params['long'] = str(long)
+      params.append(('long', long))
     return await self._request('GET', endpoint, params=params, response_model=Bookmarks)
 
   async def get_interface_texts(self, lang: typing.Literal['fr', 'de', 'en', 'lb'] = 'fr') -> dict[str, Any]:
@@ -219,6 +349,9 @@ class AsyncMeteoLuxClient:
     Returns:
         dict[str, Any]: A dictionary with translated strings.
     """
+    if lang in self._text_urls and not self.client.params:
+      return await self._request('GET', self._text_urls[lang])
+
     endpoint = '/metapp/text'
     params = {'lang': lang}
     return await self._request('GET', endpoint, params=params)
@@ -226,6 +359,9 @@ class AsyncMeteoLuxClient:
   async def stream_image(self, filename: str) -> httpx.Response:
     """Stream an image from the cluster.
 
+    The body is not read up front. Consume it with `response.aiter_bytes()` and release
+    the connection with `await response.aclose()` once done.
+
     Corresponds to GET /metapp/image/{filename}.
 
     Args:
@@ -234,8 +370,9 @@ class AsyncMeteoLuxClient:
     Returns:
         httpx.Response: The raw httpx Response object to handle streaming.
     """
-    endpoint = f'/metapp/image/{filename}'
-    return await self.client.get(endpoint, timeout=10.0)
+    endpoint = f'{self.base_url}/metapp/image/{filename}'
+    request = self.client.build_request('GET', endpoint, timeout=10.0)
+    return await self.client.send(request, stream=True)
 
   async def get_observations_metapp(self) -> list[Any]:
     """Return participative observations in the last 30 minutes.
@@ -262,8 +399,32 @@ class AsyncMeteoLuxClient:
         str: The successful response message.
     """
     endpoint = '/metapp/observation'
-    return await self._request('POST', endpoint, json=observation_data.model_dump())
+    return await self._request('POST', endpoint, body=observation_data)
+
+  # --- Convenience ---
+
+  async def get_dashboard(self, langcode: str = 'fr', lat: float | None = None, long: float | None = None) -> tuple[WeatherResponse, Bookmarks, ATCReport]:
+    """Fetch weather, bookmarks and the ATC report concurrently.
+
+    The three requests are issued at the same time, so the call takes as long as the
+    slowest of them. With the default HTTP/2 client they share a single connection.
+
+    Args:
+        langcode (str): The language code (fr, de, en, lb).
+        lat (Optional[float]): Latitude.
+        long (Optional[float]): Longitude.
+
+    Returns:
+        tuple[WeatherResponse, Bookmarks, ATCReport]: The weather, bookmarks and ATC report.
+    """
+    weather, bookmarks, atc_report = await asyncio.gather(
+      self.get_weather(langcode=langcode, lat=lat, long=long),
+      self.get_bookmarks(langcode=langcode, lat=lat, long=long),
+      self.get_atc_report(),
+    )
+    return weather, bookmarks, atc_report
 
   async def close(self) -> None:
-    """Closes the httpx client."""
-    await self.client.aclose()
+    """Closes the httpx client, unless it was passed in as session."""
+    if self._close_session:
+      await self.client.aclose()
@@ -1,19 +1,51 @@
 """API models."""
 
 from datetime import date, datetime
-from typing import Literal
+from enum import IntEnum, StrEnum
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
-class Icon(BaseModel):
+class _Base(BaseModel):
+  """Common configuration shared by all API models."""
+
+  model_config = ConfigDict(extra='ignore', populate_by_name=True)
+
+
+class Canton(StrEnum):
+  """Cantons of Luxembourg."""
+
+  CAPELLEN = 'Capellen'
+  CLERVAUX = 'Clervaux'
+  DIEKIRCH = 'Diekirch'
+  ECHTERNACH = 'Echternach'
+  ESCH_SUR_ALZETTE = 'Esch-sur-Alzette'
+  GREVENMACHER = 'Grevenmacher'
+  LUXEMBOURG = 'Luxembourg'
+  MERSCH = 'Mersch'
+  REDANGE = 'Redange'
+  REMICH = 'Remich'
+  VIANDEN = 'Vianden'
+  WILTZ = 'Wiltz'
+
+
+class VigilanceLevel(IntEnum):
+  """Vigilance (weather warning) levels."""
+
+  YELLOW = 2
+  ORANGE = 3
+  RED = 4
+
+
+class Icon(_Base):
   """Base icon."""
 
   id: int
   name: str
 
 
-class Wind(BaseModel):
+class Wind(_Base):
   """Wind model."""
 
   direction: str
@@ -21,15 +53,15 @@ class Wind(BaseModel):
   gusts: str | None = None
 
 
-class Temperature(BaseModel):
+class Temperature(_Base):
   """Temperature model."""
 
-  temperature: int | list[int]
+  temperature: int | list[int] = Field(..., union_mode='left_to_right')
   humidex: str | None = None
   felt: int | None = None
 
 
-class CurrentWeather(BaseModel):
+class CurrentWeather(_Base):
   """Part of the global weather model."""
 
   date: datetime
@@ -41,7 +73,7 @@ class CurrentWeather(BaseModel):
   temperature: Temperature
 
 
-class DailyWeather(BaseModel):
+class DailyWeather(_Base):
   """For the list of following days."""
 
   date: datetime
@@ -56,9 +88,10 @@ class DailyWeather(BaseModel):
   uv_index: int = Field(..., alias='uvIndex')
 
 
-class HourlyWeather(BaseModel):
+class HourlyWeather(_Base):
   """For the list of following hours."""
 
+  # Kept as datetime: pydantic-core parses ISO 8601 faster than a Python epoch-int validator.
   date: datetime
   icon: Icon
   wind: Wind
@@ -68,7 +101,7 @@ class HourlyWeather(BaseModel):
   temperature: Temperature
 
 
-class Trend(BaseModel):
+class Trend(_Base):
   """Forecast part of data."""
 
   date: date
@@ -77,7 +110,7 @@ class Trend(BaseModel):
   precipitation: float
 
 
-class Climatology(BaseModel):
+class Climatology(_Base):
   """History part of data."""
 
   date: datetime
@@ -88,33 +121,33 @@ class Climatology(BaseModel):
   sunshine: float | None = None
 
 
-class GraphicalData(BaseModel):
+class GraphicalData(_Base):
   """Graphical group of data."""
 
   history: list[Climatology]
   forecast: list[Trend]
 
 
-class Vigilance(BaseModel):
+class Vigilance(_Base):
   """Vigilance model."""
 
   datetime_start: datetime = Field(..., alias='datetimeStart')
   datetime_end: datetime = Field(..., alias='datetimeEnd')
-  level: Literal[2, 3, 4]
+  level: VigilanceLevel
   type: int
   group: int
   region: Literal['north', 'south', 'all']
   description: str
 
 
-class RoadStatusItem(BaseModel):
+class RoadStatusItem(_Base):
   """Road status item model as per the spec."""
 
   date: date | list[str]
   description: str
 
 
-class ImageOut(BaseModel):
+class ImageOut(_Base):
   """Image with url."""
 
   date: datetime
@@ -122,28 +155,28 @@ class ImageOut(BaseModel):
   url: str = Field(..., max_length=2083, min_length=1)
 
 
-class Radar(BaseModel):
+class Radar(_Base):
   """Radar image model."""
 
   real_time: list[ImageOut] = Field(..., alias='realTime')
   forecast: list[ImageOut]
 
 
-class Satellite(BaseModel):
+class Satellite(_Base):
   """Satellite image model."""
 
   infrared: list[ImageOut]
   visual: list[ImageOut]
 
 
-class MoonIcon(BaseModel):
+class MoonIcon(_Base):
   """As different id are used."""
 
   id: str
   name: str
 
 
-class Ephemeris(BaseModel):
+class Ephemeris(_Base):
   """Ephemeris model."""
 
   date: date
@@ -156,19 +189,19 @@ class Ephemeris(BaseModel):
   uv_index: int = Field(..., alias='uvIndex', ge=0.0, le=12.0)
 
 
-class ATCReportForecast(BaseModel):
+class ATCReportForecast(_Base):
   """Forecast for ATC dashboard."""
 
   hourly: list['HourlyWindForecast']
 
 
-class ATCReport(BaseModel):
+class ATCReport(_Base):
   """Data for ATC dashboard."""
 
   forecast: ATCReportForecast
 
 
-class HourlyWindForecast(BaseModel):
+class HourlyWindForecast(_Base):
   """Hourly wind report, at different altitude (feet)."""
 
   date: datetime
@@ -180,15 +213,13 @@ class HourlyWindForecast(BaseModel):
   wind10000: Wind
 
 
-class BookmarkCity(BaseModel):
+class BookmarkCity(_Base):
   """With additional info for mobile app ep."""
 
   id: int
   name: str
   region: Literal['N', 'S'] = 'S'
-  canton: Literal[
-    'Capellen', 'Clervaux', 'Diekirch', 'Echternach', 'Esch-sur-Alzette', 'Grevenmacher', 'Luxembourg', 'Mersch', 'Redange', 'Remich', 'Vianden', 'Wiltz'
-  ]
+  canton: Canton
   domain: Literal['villes', 'lieu', 'fluvial']
   lat: float
   long: float
@@ -196,14 +227,14 @@ class BookmarkCity(BaseModel):
   icon: Icon
 
 
-class Bookmarks(BaseModel):
+class Bookmarks(_Base):
   """Bookmarks model."""
 
   cities: list[BookmarkCity]
   nearest_city: BookmarkCity | None = Field(None, alias='nearestCity')
 
 
-class InObservation(BaseModel):
+class InObservation(_Base):
   """Observation from public users."""
 
   lat: float = Field(..., ge=-90.0, le=90.0)
@@ -212,7 +243,7 @@ class InObservation(BaseModel):
   weather: int
 
 
-class SensorLevel(BaseModel):
+class SensorLevel(_Base):
   """Sensor level definition."""
 
   level_type: Literal['height_above_ground'] = Field(..., alias='levelType')
@@ -220,7 +251,7 @@ class SensorLevel(BaseModel):
   value: float = Field(..., ge=0.0)
 
 
-class ObservationMetadata(BaseModel):
+class ObservationMetadata(_Base):
   """Sensor definition."""
 
   id: str
@@ -236,54 +267,87 @@ class ObservationMetadata(BaseModel):
   sensorlevels: SensorLevel | None = Field(..., alias='sensorLevels')
 
 
-class ObservationMetadataResponse(BaseModel):
+class ObservationMetadataResponse(_Base):
   """Elements metadata."""
 
-  licence: list[str] = ['Creative Commons', 'https://creativecommons.org/public-domain/cc0/']
+  licence: tuple[str, ...] = ('Creative Commons', 'https://creativecommons.org/public-domain/cc0/')
   doc_url: str = Field('/docs', alias='docUrl')
   data: list[ObservationMetadata]
   total_item_count: int = Field(1, alias='totalItemCount')
-  quality_codes: dict[str, str] = Field({'0': 'Value is controlled and found O.K.'}, alias='qualityCodes')
+  quality_codes: dict[str, str] = Field(default_factory=lambda: {'0': 'Value is controlled and found O.K.'}, alias='qualityCodes')
   performance_category: dict[str, str] = Field(
-    {'A': 'The sensor type fulfills the requirements from WMO/CIMOs on measurement accuracy, calibration and maintenance.'}, alias='performanceCategory'
+    default_factory=lambda: {
+      'A': 'The sensor type fulfills the requirements from WMO/CIMOs on measurement accuracy, calibration and maintenance.',
+    },
+    alias='performanceCategory',
   )
 
 
-class ObservationResponseData(BaseModel):
+class ObservationResponseData(_Base):
   """Model to link gendata id to their values."""
 
   id: str
-  value: int | float | None
+  value: float | None
 
 
-class ObservationResponse(BaseModel):
+class ObservationResponse(_Base):
   """Last Observations."""
 
-  licence: list[str] = ['Creative Commons', 'https://creativecommons.org/public-domain/cc0/']
+  licence: tuple[str, ...] = ('Creative Commons', 'https://creativecommons.org/public-domain/cc0/')
   doc_url: str = Field('/docs', alias='docUrl')
   data: list[ObservationResponseData]
   total_item_count: int = Field(1, alias='totalItemCount')
   timestamp: datetime
 
 
-class OutCity(BaseModel):
+class ObservationResponseColumns(_Base):
+  """Last Observations, stored column-wise.
+
+  Same content as `ObservationResponse`, but the sensor ids and their values are kept
+  in two parallel lists instead of one model per sensor, which is much cheaper to build
+  for large responses.
+  """
+
+  licence: tuple[str, ...] = ('Creative Commons', 'https://creativecommons.org/public-domain/cc0/')
+  doc_url: str = Field('/docs', alias='docUrl')
+  ids: list[str]
+  values: list[float | None]
+  total_item_count: int = Field(1, alias='totalItemCount')
+  timestamp: datetime
+
+  @model_validator(mode='before')
+  @classmethod
+  def _split_data(cls, raw: Any) -> Any:
+    """Split the `data` items of an `ObservationResponse` payload into ids and values."""
+    if not isinstance(raw, dict) or 'ids' in raw or 'values' in raw:
+      return raw
+    if 'data' not in raw:
+      raise ValueError("missing required field 'data'")
+
+    try:
+      ids = [item['id'] for item in raw['data']]
+      values = [item['value'] for item in raw['data']]
+    except (KeyError, TypeError) as exc:
+      raise ValueError(f'invalid observation data item, missing or malformed {exc}') from exc
+    return {**raw, 'ids': ids, 'values': values}
+
+
+class OutCity(_Base):
   """City with translated name."""
 
   id: int
   name: str
   region: Literal['N', 'S'] = 'S'
-  canton: Literal[
-    'Capellen', 'Clervaux', 'Diekirch', 'Echternach', 'Esch-sur-Alzette', 'Grevenmacher', 'Luxembourg', 'Mersch', 'Redange', 'Remich', 'Vianden', 'Wiltz'
-  ]
+  canton: Canton
   domain: Literal['villes', 'lieu', 'fluvial']
   lat: float
   long: float
 
 
-class VigilanceSettings(BaseModel):
+class VigilanceSettings(_Base):
   """User settings for notifications."""
 
-  level: Literal[2, 3, 4]
+  level: VigilanceLevel
   type_air: bool = Field(False, alias='typeAir')
   type_cold: bool = Field(False, alias='typeCold')
   type_flooding: bool = Field(False, alias='typeFlooding')
@@ -297,7 +361,7 @@ class VigilanceSettings(BaseModel):
   zone_south: bool = Field(..., alias='zoneSouth')
 
 
-class User(BaseModel):
+class User(_Base):
   """User model."""
 
   language: Literal['fr', 'de', 'en', 'lb']
@@ -310,7 +374,7 @@ class User(BaseModel):
   vigilance: VigilanceSettings
 
 
-class WeatherResponseForecast(BaseModel):
+class WeatherResponseForecast(_Base):
   """Forecast model."""
 
   current: CurrentWeather
@@ -318,7 +382,7 @@ class WeatherResponseForecast(BaseModel):
   daily: list[DailyWeather]
 
 
-class WeatherResponse(BaseModel):
+class WeatherResponse(_Base):
   """Final weather output from the backend."""
 
   city: OutCity
@@ -2,6 +2,7 @@ import json
 from typing import Any
 
 import httpx
+import pydantic
 import pytest
 
 from meteolux.async_api import AsyncMeteoLuxClient
@@ -9,7 +10,11 @@ from meteolux.exceptions import NotFoundError
 from meteolux.models import (
   ATCReport,
   Bookmarks,
+  Canton,
+  InObservation,
   ObservationMetadataResponse,
+  ObservationResponse,
+  ObservationResponseColumns,
   WeatherResponse,
 )
 
@@ -97,14 +102,10 @@ async def test_get_bookmarks_success(respx_mock) -> None:
   assert isinstance(bookmarks, Bookmarks)
   assert bookmarks.nearest_city.name == 'Luxembourg'
   assert len(bookmarks.cities) == 1
+  assert bookmarks.cities[0].canton is Canton.LUXEMBOURG
 
 
-@pytest.mark.asyncio
-async def test_get_weather_success(respx_mock) -> None:
-  """
-  Test the successful response of get_weather.
-  """
-  mock_response_data_str = """
+WEATHER_RESPONSE_JSON = """
   {
   "city": {
     "id": 456,
@@ -2073,8 +2074,15 @@ async def test_get_weather_success(respx_mock) -> None:
     ]
   }
 }
+"""
+
+
+@pytest.mark.asyncio
+async def test_get_weather_success(respx_mock) -> None:
   """
-  mock_response_data = json.loads(mock_response_data_str)
+  Test the successful response of get_weather.
+  """
+  mock_response_data = json.loads(WEATHER_RESPONSE_JSON)
 
   respx_mock.get('https://metapi.ana.lu/api/v1/metapp/weather', params={'lat': 49.6116, 'long': 6.1319, 'langcode': 'en'}).mock(
     return_value=httpx.Response(200, json=mock_response_data)
@@ -2141,6 +2149,73 @@ async def test_get_observations_metadata_hvd_success(respx_mock) -> None:
   assert metadata.data[0].unit == 'm'
 
 
+@pytest.mark.asyncio
+async def test_get_observations_hvd_success(respx_mock) -> None:
+  """
+  Test the successful response of get_observations_hvd.
+  """
+  mock_response_data = {
+    'licence': ['Creative Commons', 'https://creativecommons.org/public-domain/cc0/'],
+    'docUrl': '/docs',
+    'data': [{'id': f'sensor-{i}', 'value': i if i % 2 else i + 0.5} for i in range(1000)] + [{'id': 'offline', 'value': None}],
+    'totalItemCount': 1001,
+    'timestamp': '2025-08-02T10:00:00Z',
+  }
+
+  respx_mock.get('https://metapi.ana.lu/api/v1/hvd/observations').mock(return_value=httpx.Response(200, json=mock_response_data))
+
+  client = AsyncMeteoLuxClient()
+  observations = await client.get_observations_hvd()
+
+  assert isinstance(observations, ObservationResponse)
+  assert len(observations.data) == 1001
+  assert observations.data[0].value == 0.5
+  assert observations.data[1].value == 1.0
+  assert observations.data[-1].value is None
+  assert observations.timestamp.year == 2025
+
+  columns = await client.get_observations_hvd(fast=True)
+
+  assert isinstance(columns, ObservationResponseColumns)
+  assert columns.ids == [item.id for item in observations.data]
+  assert columns.values == [item.value for item in observations.data]
+  assert columns.timestamp == observations.timestamp
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('fast', [False, True])
+@pytest.mark.parametrize(
+  'mock_response_data',
+  [
+    {'timestamp': '2025-08-02T10:00:00Z'},
+    {'data': [{'value': 1.0}], 'timestamp': '2025-08-02T10:00:00Z'},
+    {'data': [{'id': 'sensor'}], 'timestamp': '2025-08-02T10:00:00Z'},
+  ],
+  ids=['missing-data', 'missing-id', 'missing-value'],
+)
+async def test_get_observations_hvd_invalid(respx_mock, fast, mock_response_data) -> None:
+  """
+  Test that both observation paths reject incomplete payloads with a ValidationError.
+  """
+  respx_mock.get('https://metapi.ana.lu/api/v1/hvd/observations').mock(return_value=httpx.Response(200, json=mock_response_data))
+
+  client = AsyncMeteoLuxClient()
+  with pytest.raises(pydantic.ValidationError):
+    await client.get_observations_hvd(fast=fast)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('fast', [False, True])
+async def test_get_observations_hvd_no_content(respx_mock, fast) -> None:
+  """
+  Test that a 204 response yields None on both observation paths.
+  """
+  respx_mock.get('https://metapi.ana.lu/api/v1/hvd/observations').mock(return_value=httpx.Response(204))
+
+  client = AsyncMeteoLuxClient()
+  assert await client.get_observations_hvd(fast=fast) is None
+
+
 @pytest.mark.asyncio
 async def test_error_handling(respx_mock) -> None:
   """
@@ -2151,3 +2226,194 @@ async def test_error_handling(respx_mock) -> None:
   client = AsyncMeteoLuxClient()
   with pytest.raises(NotFoundError):
     await client.get_atc_report()
+
+
+@pytest.mark.asyncio
+async def test_add_observation_success(respx_mock) -> None:
+  """
+  Test that add_observation posts the serialized observation as JSON.
+  """
+  route = respx_mock.post('https://metapi.ana.lu/api/v1/metapp/observation').mock(return_value=httpx.Response(200, json='Observation added'))
+
+  client = AsyncMeteoLuxClient()
+  observation = InObservation(lat=49.6116, long=6.1319, description='Sunny', weather=1)
+  message = await client.add_observation(observation)
+
+  assert message == 'Observation added'
+  assert route.calls.last.request.headers['Content-Type'] == 'application/json'
+  assert json.loads(route.calls.last.request.content) == {'lat': 49.6116, 'long': 6.1319, 'description': 'Sunny', 'weather': 1}
+
+
+@pytest.mark.asyncio
+async def test_context_manager_closes_own_client_only() -> None:
+  """
+  Test that the async context manager closes its own client but not an injected session.
+  """
+  async with AsyncMeteoLuxClient() as client:
+    assert not client.client.is_closed
+  assert client.client.is_closed
+
+  async with httpx.AsyncClient() as session:
+    async with AsyncMeteoLuxClient(session=session) as client:
+      assert client.client is session
+    assert not session.is_closed
+
+
+@pytest.mark.asyncio
+async def test_stream_image_success(respx_mock) -> None:
+  """
+  Test that stream_image returns an unread response that can be consumed in chunks.
+  """
+  respx_mock.get('https://metapi.ana.lu/api/v1/metapp/image/radar.png').mock(return_value=httpx.Response(200, content=b'\x89PNG' * 1024))
+
+  client = AsyncMeteoLuxClient()
+  response = await client.stream_image('radar.png')
+
+  assert not response.is_stream_consumed
+  body = b''.join([chunk async for chunk in response.aiter_bytes()])
+  await response.aclose()
+
+  assert body == b'\x89PNG' * 1024
+
+
+@pytest.mark.asyncio
+async def test_get_interface_texts_success(respx_mock) -> None:
+  """
+  Test the successful response of get_interface_texts.
+  """
+  respx_mock.get('https://metapi.ana.lu/api/v1/metapp/text', params={'lang': 'de'}).mock(return_value=httpx.Response(200, json={'title': 'Wetter'}))
+
+  client = AsyncMeteoLuxClient()
+  texts = await client.get_interface_texts(lang='de')
+
+  assert texts == {'title': 'Wetter'}
+
+
+@pytest.mark.asyncio
+async def test_error_handling_server_error(respx_mock) -> None:
+  """
+  Test that a non-404 HTTP error status code raises an httpx.HTTPStatusError.
+  """
+  respx_mock.get('https://metapi.ana.lu/api/v1/atc/report').mock(return_value=httpx.Response(500, json={'detail': 'Internal Server Error'}))
+
+  client = AsyncMeteoLuxClient()
+  with pytest.raises(httpx.HTTPStatusError):
+    await client.get_atc_report()
+
+
+@pytest.mark.asyncio
+async def test_msgpack_response(respx_mock) -> None:
+  """
+  Test that MessagePack responses are decoded when requested via the Accept header.
+  """
+  msgpack = pytest.importorskip('msgpack')
+  mock_response_data = {
+    'cities': [
+      {
+        'id': 1,
+        'name': 'Luxembourg',
+        'canton': 'Luxembourg',
+        'domain': 'villes',
+        'lat': 49.6116,
+        'long': 6.1319,
+        'temperature': 20.5,
+        'icon': {'id': 1, 'name': 'sun'},
+      }
+    ],
+  }
+
+  route = respx_mock.get('https://metapi.ana.lu/api/v1/metapp/bookmarks', params={'langcode': 'fr'}).mock(
+    return_value=httpx.Response(200, content=msgpack.packb(mock_response_data), headers={'Content-Type': 'Application/MsgPack'})
+  )
+
+  client = AsyncMeteoLuxClient(accept='application/msgpack')
+  bookmarks = await client.get_bookmarks()
+
+  assert route.calls.last.request.headers['Accept'] == 'application/msgpack'
+  assert isinstance(bookmarks, Bookmarks)
+  assert bookmarks.cities[0].name == 'Luxembourg'
+  assert bookmarks.nearest_city is None
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_success(respx_mock) -> None:
+  """
+  Test that get_dashboard returns weather, bookmarks and ATC report as a tuple.
+  """
+  respx_mock.get('https://metapi.ana.lu/api/v1/metapp/weather', params={'langcode': 'en', 'lat': 49.6116, 'long': 6.1319}).mock(
+    return_value=httpx.Response(200, content=WEATHER_RESPONSE_JSON)
+  )
+  respx_mock.get('https://metapi.ana.lu/api/v1/metapp/bookmarks', params={'langcode': 'en', 'lat': 49.6116, 'long': 6.1319}).mock(
+    return_value=httpx.Response(200, json={'cities': []})
+  )
+  respx_mock.get('https://metapi.ana.lu/api/v1/atc/report').mock(return_value=httpx.Response(200, json={'forecast': {'hourly': []}}))
+
+  client = AsyncMeteoLuxClient()
+  dashboard = await client.get_dashboard(langcode='en', lat=49.6116, long=6.1319)
+
+  assert isinstance(dashboard, tuple)
+  weather, bookmarks, atc_report = dashboard
+  assert isinstance(weather, WeatherResponse)
+  assert isinstance(bookmarks, Bookmarks)
+  assert isinstance(atc_report, ATCReport)
+
+
+def test_msgpack_accept_without_msgpack(monkeypatch) -> None:
+  """
+  Test that accepting MessagePack without the msgpack package fails early, wherever it is listed.
+  """
+  monkeypatch.setattr('meteolux.async_api.msgpack', None)
+
+  with pytest.raises(ImportError):
+    AsyncMeteoLuxClient(accept='application/json, application/msgpack')
+
+
+@pytest.mark.asyncio
+async def test_msgpack_response_without_msgpack(respx_mock, monkeypatch) -> None:
+  """
+  Test that an unrequested MessagePack response without the msgpack package raises ImportError.
+  """
+  monkeypatch.setattr('meteolux.async_api.msgpack', None)
+  respx_mock.get('https://metapi.ana.lu/api/v1/atc/report').mock(
+    return_value=httpx.Response(200, content=b'\x81', headers={'Content-Type': 'application/msgpack'})
+  )
+
+  client = AsyncMeteoLuxClient()
+  with pytest.raises(ImportError):
+    await client.get_atc_report()
+
+
+@pytest.mark.asyncio
+async def test_language_query_with_session_params(respx_mock) -> None:
+  """
+  Test that the language parameter is kept alongside the default params of an injected session.
+  """
+  texts_route = respx_mock.get('https://metapi.ana.lu/api/v1/metapp/text', params={'k': 'v', 'lang': 'de'}).mock(
+    return_value=httpx.Response(200, json={'title': 'Wetter'})
+  )
+  bookmarks_route = respx_mock.get('https://metapi.ana.lu/api/v1/metapp/bookmarks', params={'k': 'v', 'langcode': 'de'}).mock(
+    return_value=httpx.Response(200, json={'cities': []})
+  )
+  weather_route = respx_mock.get('https://metapi.ana.lu/api/v1/metapp/weather', params={'k': 'v', 'langcode': 'de'}).mock(
+    return_value=httpx.Response(200, content=WEATHER_RESPONSE_JSON)
+  )
+
+  async with httpx.AsyncClient(params={'k': 'v'}) as session:
+    client = AsyncMeteoLuxClient(session=session)
+    await client.get_interface_texts(lang='de')
+    await client.get_bookmarks(langcode='de')
+    await client.get_weather(langcode='de')
+
+  assert dict(texts_route.calls.last.request.url.params) == {'k': 'v', 'lang': 'de'}
+  assert dict(bookmarks_route.calls.last.request.url.params) == {'k': 'v', 'langcode': 'de'}
+  assert dict(weather_route.calls.last.request.url.params) == {'k': 'v', 'langcode': 'de'}
+
+
+@pytest.mark.asyncio
+async def test_accept_with_session() -> None:
+  """
+  Test that accept cannot be combined with an injected session.
+  """
+  async with httpx.AsyncClient() as session:
+    with pytest.raises(ValueError, match='accept'):
+      AsyncMeteoLuxClient(session=session, accept='application/msgpack')